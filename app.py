@@ -5,6 +5,8 @@ import json, os, hashlib, re, datetime, uuid
 import matplotlib.pyplot as plt
 from sklearn.metrics import confusion_matrix, roc_curve, auc
 import seaborn as sns
+from exports import consume_export, export_filename, export_path, prune_exports, write_export
+from churn_rollups import ROLLUP_DIMENSIONS, ensure_rollups, load_rollups, update_rollups, clear_rollups, rollup_rows
 
 # -----------------------
 # Config
@@ -82,13 +84,23 @@ def _log_action(action,email):
     with open(AUDIT_LOG_PATH,"w") as f: json.dump(logs,f,indent=2)
 
 def _save_prediction_history(entry: dict):
+    _save_prediction_entries([entry])
+
+def _save_prediction_entries(entries: list):
+    """Appends entries to the history and folds them into the rollups in one write each."""
+    ensure_rollups(PRED_HISTORY_PATH)
     history = _load_prediction_history()
-    history.append(entry)
+    history.extend(entries)
     try:
         with open(PRED_HISTORY_PATH, "w", encoding="utf-8") as f:
             json.dump(history, f, indent=2)
     except Exception as e:
         st.error(f"Error saving prediction history: {e}")
+        return
+    try:
+        update_rollups(entries)
+    except Exception as e:
+        st.error(f"Error updating churn rollups: {e}")
 
 def _load_prediction_history() -> list:
     """Loads prediction history safely, resets if file is corrupted."""
@@ -103,6 +115,7 @@ def _load_prediction_history() -> list:
         st.warning("Prediction history file was corrupted. Resetting it.")
         with open(PRED_HISTORY_PATH, "w", encoding="utf-8") as f:
             json.dump([], f, indent=2)
+        clear_rollups()
         return []
 
 
@@ -115,6 +128,64 @@ def _load_model_and_columns():
         st.error(f"Load model error: {e}")
         return None,[]
 
+def _show_churn_rollups():
+    """Renders churn rates from the materialized rollups (no scan of the raw history)."""
+    ensure_rollups(PRED_HISTORY_PATH)
+    rollups=load_rollups()
+    total=rollups["total"]
+    if not total["count"]:
+        st.info("No predictions yet.")
+        return False
+    c1,c2,c3=st.columns(3)
+    c1.metric("Predictions",total["count"])
+    c2.metric("Predicted Churn",total["churn"])
+    c3.metric("Churn Rate",f"{total['churn']/total['count']:.1%}")
+    tabs=st.tabs(ROLLUP_DIMENSIONS)
+    for tab,dim in zip(tabs,ROLLUP_DIMENSIONS):
+        with tab:
+            df=pd.DataFrame(rollup_rows(rollups,dim))
+            if df.empty: st.write("No data"); continue
+            st.dataframe(df)
+            st.bar_chart(df.set_index(dim)["churn_rate"])
+    return True
+
+def _discard_export(name):
+    out_path=st.session_state.pop(f"{name}_export_file",{}).get("path")
+    if out_path and os.path.exists(out_path): os.remove(out_path)
+
+def _export_section(store_path,name,with_prediction=False):
+    """Streams a filtered CSV export to disk only when requested, then offers it for download."""
+    with st.form(f"{name}_export"):
+        st.subheader("Export CSV")
+        c1,c2=st.columns(2)
+        start=c1.date_input("From",value=None,key=f"{name}_export_start")
+        end=c2.date_input("To",value=None,key=f"{name}_export_end")
+        prediction=st.selectbox("Prediction",["All","Churn","No Churn"],key=f"{name}_export_pred") if with_prediction else "All"
+        compress=st.checkbox("Gzip compress",key=f"{name}_export_gzip")
+        submit=st.form_submit_button("Prepare export")
+    if submit:
+        _discard_export(name)
+        prune_exports()
+        prediction=None if prediction=="All" else prediction
+        file_name=export_filename(name,start,end,prediction,compress)
+        try:
+            with st.spinner("Exporting..."):
+                out_path=write_export(store_path,export_path(file_name),start,end,prediction,compress)
+            st.session_state[f"{name}_export_file"]={"path":out_path,"file_name":file_name}
+        except Exception as e:
+            st.error(f"Export failed: {e}")
+    export=st.session_state.get(f"{name}_export_file")
+    if not export: return
+    if not os.path.exists(export["path"]):
+        st.session_state.pop(f"{name}_export_file",None)
+        return
+    # The file is only read when the button is clicked (st.download_button
+    # needs the bytes in memory then); it is removed once served
+    out_path=export["path"]
+    st.download_button("Download CSV",lambda: consume_export(out_path),export["file_name"],
+                       mime="application/gzip" if out_path.endswith(".gz") else "text/csv",
+                       on_click=lambda: st.session_state.pop(f"{name}_export_file",None))
+
 # -----------------------
 # Styles
 # -----------------------
@@ -181,21 +252,23 @@ def page_dashboard():
 
 def page_history():
     st.markdown("<div class='card'><h2>📜 Prediction History</h2></div>", unsafe_allow_html=True)
-    history = _load_prediction_history()
-    if not history:
-        st.info("No predictions yet.")
+    if not _show_churn_rollups():
         return
-    try:
-        df = pd.DataFrame(history)
-        st.dataframe(df)
-        st.download_button("Download CSV", df.to_csv(index=False), "history.csv")
-    except Exception as e:
-        st.error(f"Error loading prediction history: {e}")
-        st.warning("Prediction history file may be corrupted. Try clearing history.")
+    # The raw history is only loaded when explicitly requested
+    if st.checkbox("Show raw predictions"):
+        try:
+            df = pd.DataFrame(_load_prediction_history())
+            st.dataframe(df)
+        except Exception as e:
+            st.error(f"Error loading prediction history: {e}")
+            st.warning("Prediction history file may be corrupted. Try clearing history.")
+    _export_section(PRED_HISTORY_PATH, "history", with_prediction=True)
     if st.button("Clear History"):
         if os.path.exists(PRED_HISTORY_PATH):
             os.remove(PRED_HISTORY_PATH)
-            st.success("Prediction history cleared. Please reload the page.")
+        clear_rollups()
+        _discard_export("history")
+        st.success("Prediction history cleared. Please reload the page.")
 
 def page_user_mgmt():
     st.markdown("<div class='card'><h2>👥 User Management</h2></div>",unsafe_allow_html=True)
@@ -247,8 +320,8 @@ def page_batch_upload():
             preds=model.predict(df_dummies)
             df["Prediction"]=["Churn" if p==1 else "No Churn" for p in preds]
             st.dataframe(df)
-            for i,row in df.iterrows():
-                _save_prediction_history({**row.to_dict(),"timestamp":datetime.datetime.now().isoformat()})
+            timestamp=datetime.datetime.now().isoformat()
+            _save_prediction_entries([{**row,"timestamp":timestamp} for row in df.to_dict("records")])
             _log_action("Batch prediction",st.session_state['auth']['email'])
             st.success("Batch predictions saved!")
 
@@ -259,7 +332,7 @@ def page_audit_log():
         logs=json.load(open(AUDIT_LOG_PATH))
     if not logs: st.info("No logs yet"); return
     st.dataframe(pd.DataFrame(logs))
-    st.download_button("Download CSV",pd.DataFrame(logs).to_csv(index=False),"audit_log.csv")
+    _export_section(AUDIT_LOG_PATH,"audit_log")
 
 def page_settings_help():
     st.markdown("<div class='card'><h2>⚙️ Settings & Help</h2></div>",unsafe_allow_html=True)
@@ -520,6 +593,10 @@ def page_data_analysis():
             ax.set_title(f"Distribution of {col}")
             st.pyplot(fig)
 
+    # Churn rates across all stored predictions, read from the rollups
+    st.subheader("Stored Prediction Churn Rates")
+    _show_churn_rollups()
+
 
 def show_app_page():
     _inject_app_styles()
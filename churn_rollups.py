@@ -0,0 +1,141 @@
+"""Materialized churn aggregates for the prediction history.
+
+The rollups file holds small count tables (total / churned) keyed by day,
+Gender, Married, Contract, State and tenure bucket. It is updated on every
+history write so the dashboards never have to scan the raw history.
+
+Rebuild it offline from the raw history with:
+
+    python churn_rollups.py [prediction_history.json] [prediction_rollups.json]
+"""
+import json, os, sys
+
+PRED_HISTORY_PATH = "prediction_history.json"
+ROLLUPS_PATH = "prediction_rollups.json"
+
+ROLLUP_DIMENSIONS = ["day", "Gender", "Married", "Contract", "State", "tenure_bucket"]
+# (exclusive upper bound in months, label); half-open so fractional tenures fit
+TENURE_BUCKETS = [(13, "0-12"), (25, "13-24"), (37, "25-36"), (49, "37-48"), (61, "49-60")]
+UNKNOWN = "Unknown"
+
+
+def _empty_rollups():
+    rollups = {"total": {"count": 0, "churn": 0}}
+    for dim in ROLLUP_DIMENSIONS:
+        rollups[dim] = {}
+    return rollups
+
+
+def _tenure_bucket(tenure):
+    try:
+        months = float(tenure)
+    except (TypeError, ValueError):
+        return UNKNOWN
+    if months != months or months < 0:  # NaN or invalid
+        return UNKNOWN
+    for upper, label in TENURE_BUCKETS:
+        if months < upper:
+            return label
+    return "61+"
+
+
+def _is_churn(entry):
+    # Single predictions store "prediction", batch rows keep the "Prediction" column
+    label = entry.get("prediction", entry.get("Prediction"))
+    return label == "Churn" or label == 1
+
+
+def _dimension_keys(entry):
+    keys = {"day": str(entry.get("timestamp") or "")[:10] or UNKNOWN,
+            "tenure_bucket": _tenure_bucket(entry.get("Tenure_in_Months"))}
+    for dim in ("Gender", "Married", "Contract", "State"):
+        value = entry.get(dim)
+        keys[dim] = UNKNOWN if value is None or value != value or value == "" else str(value)
+    return keys
+
+
+def _apply(rollups, entry):
+    churn = 1 if _is_churn(entry) else 0
+    rollups["total"]["count"] += 1
+    rollups["total"]["churn"] += churn
+    for dim, key in _dimension_keys(entry).items():
+        cell = rollups[dim].setdefault(key, {"count": 0, "churn": 0})
+        cell["count"] += 1
+        cell["churn"] += churn
+
+
+def load_rollups(path=ROLLUPS_PATH):
+    """Loads the rollups, returning empty tables if the file is missing or corrupted."""
+    if not os.path.exists(path):
+        return _empty_rollups()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            rollups = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return _empty_rollups()
+    for key, value in _empty_rollups().items():
+        rollups.setdefault(key, value)
+    return rollups
+
+
+def save_rollups(rollups, path=ROLLUPS_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(rollups, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def update_rollups(entries, path=ROLLUPS_PATH):
+    """Folds newly written history entries into the stored rollups."""
+    rollups = load_rollups(path)
+    for entry in entries:
+        _apply(rollups, entry)
+    save_rollups(rollups, path)
+    return rollups
+
+
+def rebuild_rollups(history_path=PRED_HISTORY_PATH, path=ROLLUPS_PATH):
+    """Recomputes the rollups from scratch from the raw prediction history.
+
+    A corrupted history counts as empty, matching how the app resets it.
+    """
+    rollups = _empty_rollups()
+    history = []
+    if os.path.exists(history_path):
+        try:
+            with open(history_path, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except json.JSONDecodeError:
+            history = []
+    for entry in history:
+        _apply(rollups, entry)
+    save_rollups(rollups, path)
+    return rollups
+
+
+def ensure_rollups(history_path=PRED_HISTORY_PATH, path=ROLLUPS_PATH):
+    """Builds the rollups once from an existing history that predates them."""
+    if not os.path.exists(path) and os.path.exists(history_path):
+        rebuild_rollups(history_path, path)
+
+
+def clear_rollups(path=ROLLUPS_PATH):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def rollup_rows(rollups, dim):
+    """Returns [{dim, count, churn, churn_rate}] rows for one dimension, sorted by key."""
+    rows = []
+    for key in sorted(rollups.get(dim, {})):
+        cell = rollups[dim][key]
+        rate = cell["churn"] / cell["count"] if cell["count"] else 0.0
+        rows.append({dim: key, "count": cell["count"], "churn": cell["churn"], "churn_rate": round(rate, 4)})
+    return rows
+
+
+if __name__ == "__main__":
+    history_path = sys.argv[1] if len(sys.argv) > 1 else PRED_HISTORY_PATH
+    rollups_path = sys.argv[2] if len(sys.argv) > 2 else ROLLUPS_PATH
+    result = rebuild_rollups(history_path, rollups_path)
+    print(f"✅ Rebuilt rollups from {result['total']['count']} predictions -> {rollups_path}")
@@ -0,0 +1,184 @@
+"""Streaming CSV exports for the prediction history and audit log.
+
+The stores are JSON arrays; records are decoded one at a time and written
+out in chunks of CSV rows (optionally gzip-compressed), so an export never
+holds the whole store or the whole file in memory.
+
+    python exports.py prediction_history.json history.csv.gz --start 2025-01-01 --prediction Churn
+"""
+import argparse, csv, datetime, io, json, os, time, uuid, zlib
+
+BLOCK_SIZE = 1 << 16
+CHUNK_ROWS = 10_000
+EXPORT_DIR = "exports"
+EXPORT_MAX_AGE = 60 * 60  # seconds an unclaimed export is kept
+
+
+def iter_json_array(path, block_size=BLOCK_SIZE):
+    """Yields the objects of a top-level JSON array without loading the whole file."""
+    if not os.path.exists(path):
+        return
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        # state: "open" expects "[", "first" a value or "]", "value" a value,
+        # "next" a "," or "]"
+        buf, pos, eof, state = "", 0, False, "open"
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                ch = buf[pos]
+                if state == "open":
+                    if ch != "[":
+                        raise ValueError(f"{path} is not a JSON array")
+                    state, pos = "first", pos + 1
+                    continue
+                if state == "next":
+                    if ch == "]":
+                        return
+                    if ch != ",":
+                        raise ValueError(f"{path}: expected ',' or ']' between array items")
+                    state, pos = "value", pos + 1
+                    continue
+                if ch == "]" and state == "first":
+                    return
+                if ch in ",]":
+                    raise ValueError(f"{path}: unexpected '{ch}' in JSON array")
+                try:
+                    obj, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A value at the end of the buffer may be cut off (e.g. a
+                    # number split across blocks), so only accept it once the
+                    # following delimiter has been read
+                    after = end
+                    while after < len(buf) and buf[after] in " \t\r\n":
+                        after += 1
+                    if eof or (after < len(buf) and buf[after] in ",]"):
+                        yield obj
+                        state, pos = "next", end
+                        continue
+            elif eof:
+                raise ValueError(f"{path}: unexpected end of JSON array")
+            block = f.read(block_size)
+            eof = not block
+            buf, pos = buf[pos:] + block, 0
+
+
+def _prediction_label(record):
+    return record.get("prediction", record.get("Prediction"))
+
+
+def iter_records(path, start=None, end=None, prediction=None):
+    """Yields records whose timestamp day lies in [start, end] and whose prediction matches."""
+    start = start.isoformat() if start else None
+    end = end.isoformat() if end else None
+    for record in iter_json_array(path):
+        day = str(record.get("timestamp") or "")[:10]
+        if start and day < start: continue
+        if end and day > end: continue
+        if prediction and _prediction_label(record) != prediction: continue
+        yield record
+
+
+def _fieldnames(records):
+    fields = {}
+    for record in records:
+        for key in record:
+            fields.setdefault(key, None)
+    return list(fields)
+
+
+def iter_csv_export(path, start=None, end=None, prediction=None, compress=False, chunk_rows=CHUNK_ROWS):
+    """Yields the filtered store as CSV bytes, chunk_rows rows at a time."""
+    # First pass only collects the header: history rows from single and batch
+    # predictions have different columns
+    fields = _fieldnames(iter_records(path, start, end, prediction))
+    gz = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fields, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+
+    def flush():
+        data = buf.getvalue().encode("utf-8")
+        buf.seek(0); buf.truncate()
+        return gz.compress(data) if gz else data
+
+    rows = 0
+    for record in iter_records(path, start, end, prediction):
+        writer.writerow(record)
+        rows += 1
+        if rows % chunk_rows == 0:
+            chunk = flush()
+            if chunk: yield chunk
+    chunk = flush()
+    if gz: chunk += gz.flush()
+    if chunk: yield chunk
+
+
+def write_export(path, out_path, start=None, end=None, prediction=None, compress=False):
+    """Streams a filtered CSV export of `path` to `out_path` and returns `out_path`."""
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    tmp_path = f"{out_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in iter_csv_export(path, start, end, prediction, compress):
+                f.write(chunk)
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return out_path
+
+
+def consume_export(out_path):
+    """Returns the bytes of a finished export and removes it, so it is served once."""
+    try:
+        with open(out_path, "rb") as f:
+            return f.read()
+    finally:
+        if os.path.exists(out_path):
+            os.remove(out_path)
+
+
+def prune_exports(export_dir=EXPORT_DIR, max_age=EXPORT_MAX_AGE):
+    """Removes exports (and leftover temp files) older than max_age seconds."""
+    if not os.path.isdir(export_dir):
+        return
+    cutoff = time.time() - max_age
+    for name in os.listdir(export_dir):
+        path = os.path.join(export_dir, name)
+        try:
+            if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def export_filename(name, start=None, end=None, prediction=None, compress=False):
+    """Download name for an export; store it on disk via export_path."""
+    parts = [name]
+    if start: parts.append(f"from-{start.isoformat()}")
+    if end: parts.append(f"to-{end.isoformat()}")
+    if prediction: parts.append(prediction.lower().replace(" ", "-"))
+    return "_".join(parts) + (".csv.gz" if compress else ".csv")
+
+
+def export_path(file_name, export_dir=EXPORT_DIR):
+    """Unique on-disk path, so concurrent sessions with the same filters never collide."""
+    return os.path.join(export_dir, f"{uuid.uuid4().hex}_{file_name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a prediction history or audit log store to CSV")
+    parser.add_argument("store", help="JSON store, e.g. prediction_history.json or audit_log.json")
+    parser.add_argument("output", help="output path; gzip-compressed if it ends in .gz")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--end", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--prediction", default=None, help="e.g. Churn or 'No Churn'")
+    args = parser.parse_args()
+
+    write_export(args.store, args.output, args.start, args.end, args.prediction, args.output.endswith(".gz"))
+    print(f"✅ Exported {args.store} -> {args.output}")
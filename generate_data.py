@@ -0,0 +1,250 @@
+"""Synthetic customer data generator for load and scaling tests.
+
+Learns per-column marginals from Customer_Data.csv plus a few conditional
+distributions (internet add-ons by Internet_Service, monthly charge and churn
+status by Contract and Internet_Type, total charges as a multiple of the
+monthly charge by Contract, churn reasons by status) and streams any number
+of rows to CSV or Parquet. Chunks are generated in parallel, each from its own seed
+derived from (seed, chunk index), so the output only depends on --seed and
+--chunk-size and memory stays bounded by a few chunks in flight.
+
+    python generate_data.py --rows 1000000 --output customers_1m.csv
+    python generate_data.py --rows 10000000 --output customers_10m.parquet --workers 8
+"""
+import argparse, os, time
+from collections import deque
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+SOURCE_PATH = "Customer_Data.csv"
+N_QUANTILES = 1001
+MAX_DISCRETE_VALUES = 100
+
+# child column -> parent column(s) it is sampled conditionally on, in sampling
+# order. Contract x Internet_Type is the main churn driver in the source (0.59
+# for Month-to-Month fiber down to 0.01 for Two Year without internet)
+CONDITIONALS = {
+    "Multiple_Lines": "Phone_Service",
+    "Internet_Type": ("Contract", "Internet_Service"),
+    "Online_Security": "Internet_Service",
+    "Online_Backup": "Internet_Service",
+    "Device_Protection_Plan": "Internet_Service",
+    "Premium_Support": "Internet_Service",
+    "Streaming_TV": "Internet_Service",
+    "Streaming_Movies": "Internet_Service",
+    "Streaming_Music": "Internet_Service",
+    "Unlimited_Data": "Internet_Service",
+    "Monthly_Charge": ("Contract", "Internet_Type"),
+    "Customer_Status": ("Contract", "Internet_Type"),
+}
+# Sampled jointly given Customer_Status so category and reason stay consistent
+CHURN_DETAIL_COLUMNS = ["Churn_Category", "Churn_Reason"]
+# Total_Charges is sampled as a ratio of Monthly_Charge (see _sample_total_charges)
+DERIVED_COLUMNS = ["Customer_ID", "Total_Charges", "Total_Revenue"]
+
+
+def _parent_values(data, parent):
+    """Conditioning key per row; multi-column parents are joined as "a|b"."""
+    if isinstance(parent, str):
+        return np.asarray(data[parent])
+    parts = [pd.Series(np.asarray(data[col]), dtype=object).fillna("None").astype(str) for col in parent]
+    return parts[0].str.cat(parts[1:], sep="|").to_numpy()
+
+
+def _fit_column(series):
+    """Returns a sampling spec: empirical frequencies or a quantile grid."""
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.dropna()
+        is_integer = bool((values == values.round()).all())
+        if not (is_integer and values.nunique() <= MAX_DISCRETE_VALUES):
+            grid = np.quantile(values.to_numpy(dtype=float), np.linspace(0, 1, N_QUANTILES))
+            return {"kind": "continuous", "quantiles": grid}
+    counts = series.value_counts(dropna=False, normalize=True)
+    if pd.api.types.is_numeric_dtype(series) and not counts.index.hasnans:
+        values = counts.index.to_numpy()
+    else:
+        values = np.array([None if pd.isna(v) else v for v in counts.index], dtype=object)
+    return {"kind": "discrete", "values": values, "probs": counts.to_numpy(dtype=float)}
+
+
+def fit_model(path=SOURCE_PATH):
+    """Learns marginals and conditionals from the source customer CSV."""
+    df = pd.read_csv(path)
+    columns = list(df.columns)
+    model = {"columns": columns, "marginals": {}, "conditionals": {},
+             "dtypes": {col: _dtype_name(df[col]) for col in columns}}
+    skip = set(CONDITIONALS) | set(CHURN_DETAIL_COLUMNS) | set(DERIVED_COLUMNS)
+    for col in model["columns"]:
+        if col not in skip:
+            model["marginals"][col] = _fit_column(df[col])
+    for child, parent in CONDITIONALS.items():
+        groups = df.groupby(_parent_values(df, parent))
+        model["conditionals"][child] = {key: _fit_column(group[child]) for key, group in groups}
+
+    # Total_Charges / Monthly_Charge per Contract keeps the two correlated and
+    # Total_Charges >= Monthly_Charge; non-positive monthly charges (credits)
+    # get totals from their own empirical distribution
+    positive = df[df["Monthly_Charge"] > 0]
+    ratio = (positive["Total_Charges"] / positive["Monthly_Charge"]).clip(lower=1.0)
+    model["charge_ratio"] = {key: _fit_column(group) for key, group in ratio.groupby(positive["Contract"])}
+    credits = df.loc[df["Monthly_Charge"] <= 0, "Total_Charges"]
+    model["credit_total_charges"] = _fit_column(credits if len(credits) else df["Total_Charges"])
+
+    churned = df[df["Customer_Status"] == "Churned"]
+    pairs = churned[CHURN_DETAIL_COLUMNS].astype(object).where(churned[CHURN_DETAIL_COLUMNS].notna(), None)
+    counts = pairs.value_counts(dropna=False, normalize=True)
+    model["churn_details"] = {"values": list(counts.index), "probs": counts.to_numpy(dtype=float)}
+    return model
+
+
+def _dtype_name(series):
+    if pd.api.types.is_integer_dtype(series):
+        return "int64"
+    if pd.api.types.is_float_dtype(series):
+        return "float64"
+    return "string"
+
+
+def _sample(spec, rng, n):
+    if spec["kind"] == "continuous":
+        grid = spec["quantiles"]
+        return np.round(np.interp(rng.random(n), np.linspace(0, 1, len(grid)), grid), 2)
+    return rng.choice(spec["values"], size=n, p=spec["probs"])
+
+
+def _sample_conditional(specs, parent, rng):
+    out = np.empty(len(parent), dtype=object)
+    for key, spec in specs.items():
+        mask = parent == key
+        if mask.any():
+            out[mask] = _sample(spec, rng, int(mask.sum()))
+    return out
+
+
+def _sample_total_charges(model, monthly, contract, rng):
+    total = np.empty(len(monthly), dtype=float)
+    positive = monthly > 0
+    for key, spec in model["charge_ratio"].items():
+        mask = positive & (contract == key)
+        if mask.any():
+            total[mask] = monthly[mask] * _sample(spec, rng, int(mask.sum()))
+    credits = ~positive
+    if credits.any():
+        total[credits] = _sample(model["credit_total_charges"], rng, int(credits.sum()))
+    return np.round(np.maximum(total, monthly), 2)
+
+
+def generate_chunk(model, seed, chunk_index, start, n):
+    """Generates rows [start, start + n) with a RNG seeded from (seed, chunk_index)."""
+    rng = np.random.default_rng([seed, chunk_index])
+    data = {col: _sample(spec, rng, n) for col, spec in model["marginals"].items()}
+    for child, parent in CONDITIONALS.items():
+        data[child] = _sample_conditional(model["conditionals"][child], _parent_values(data, parent), rng)
+    data["Monthly_Charge"] = data["Monthly_Charge"].astype(float)
+    data["Total_Charges"] = _sample_total_charges(model, data["Monthly_Charge"], data["Contract"], rng)
+
+    details = model["churn_details"]
+    churned = data["Customer_Status"] == "Churned"
+    picks = rng.choice(len(details["values"]), size=int(churned.sum()), p=details["probs"])
+    for i, col in enumerate(CHURN_DETAIL_COLUMNS):
+        data[col] = np.full(n, None, dtype=object)
+        data[col][churned] = [details["values"][p][i] for p in picks]
+
+    states = pd.Series(data["State"], dtype=str).str[:3].str.upper()
+    data["Customer_ID"] = (pd.Series(np.arange(start, start + n)).astype(str).str.zfill(9) + "-" + states).to_numpy()
+    data["Total_Revenue"] = np.round(data["Total_Charges"] - data["Total_Refunds"]
+                                     + data["Total_Extra_Data_Charges"] + data["Total_Long_Distance_Charges"], 2)
+    return pd.DataFrame({col: data[col] for col in model["columns"]})
+
+
+_worker_model = None
+
+def _init_worker(model):
+    global _worker_model
+    _worker_model = model
+
+def _generate_in_worker(args):
+    return generate_chunk(_worker_model, *args)
+
+
+class _CsvSink:
+    def __init__(self, path, model):
+        self.path = path
+        # Header is written up front so even --rows 0 produces a valid file
+        pd.DataFrame(columns=model["columns"]).to_csv(path, index=False)
+
+    def write(self, df):
+        df.to_csv(self.path, mode="a", header=False, index=False)
+
+    def close(self):
+        pass
+
+
+class _ParquetSink:
+    def __init__(self, path, model):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise SystemExit("Parquet output requires pyarrow: pip install pyarrow") from e
+        # Schema comes from the fitted model, not the first chunk, so columns
+        # that happen to be all-null in a chunk (e.g. Churn_Reason) stay strings
+        types = {"int64": pa.int64(), "float64": pa.float64(), "string": pa.string()}
+        self.schema = pa.schema([(col, types[model["dtypes"][col]]) for col in model["columns"]])
+        self.pa, self.writer = pa, pq.ParquetWriter(path, self.schema)
+
+    def write(self, df):
+        self.writer.write_table(self.pa.Table.from_pandas(df, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        self.writer.close()
+
+
+def generate(rows, output, source=SOURCE_PATH, seed=42, chunk_size=100_000, workers=None):
+    """Streams `rows` synthetic customers to `output` (.csv or .parquet)."""
+    model = fit_model(source)
+    sink = _ParquetSink(output, model) if output.endswith(".parquet") else _CsvSink(output, model)
+    tasks = ((seed, i, start, min(chunk_size, rows - start))
+             for i, start in enumerate(range(0, rows, chunk_size)))
+    workers = workers or os.cpu_count() or 1
+    written = 0
+    try:
+        if workers == 1:
+            for task in tasks:
+                df = generate_chunk(model, *task)
+                sink.write(df)
+                written += len(df)
+            return written
+        with Pool(workers, initializer=_init_worker, initargs=(model,)) as pool:
+            # Keep at most 2 chunks per worker in flight so memory stays bounded
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.apply_async(_generate_in_worker, (task,)))
+                if len(pending) >= 2 * workers:
+                    df = pending.popleft().get()
+                    sink.write(df)
+                    written += len(df)
+            while pending:
+                df = pending.popleft().get()
+                sink.write(df)
+                written += len(df)
+        return written
+    finally:
+        sink.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic customer data")
+    parser.add_argument("--rows", type=int, required=True, help="number of rows to generate")
+    parser.add_argument("--output", required=True, help="output path ending in .csv or .parquet")
+    parser.add_argument("--source", default=SOURCE_PATH, help="CSV to learn distributions from")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the CPU count")
+    args = parser.parse_args()
+
+    started = time.time()
+    n = generate(args.rows, args.output, args.source, args.seed, args.chunk_size, args.workers)
+    print(f"✅ Wrote {n} rows to {args.output} in {time.time() - started:.1f}s")
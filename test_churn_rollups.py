@@ -0,0 +1,83 @@
+import json
+
+import churn_rollups as cr
+
+HISTORY = [
+    {"prediction": "Churn", "timestamp": "2025-01-01T10:00:00", "Gender": "Male", "Married": "No", "Tenure_in_Months": 5},
+    {"Prediction": "No Churn", "timestamp": "2025-01-02 09:00:00", "Gender": "Female", "Contract": "One Year",
+     "State": "Delhi", "Tenure_in_Months": 70},
+    {"Prediction": "Churn", "timestamp": "2025-01-02T11:00:00", "Gender": "Female", "Contract": "",
+     "Tenure_in_Months": float("nan")},
+]
+
+
+def test_tenure_bucket_half_open():
+    assert cr._tenure_bucket(0) == "0-12"
+    assert cr._tenure_bucket(12) == "0-12"
+    assert cr._tenure_bucket(12.5) == "0-12"
+    assert cr._tenure_bucket(13) == "13-24"
+    assert cr._tenure_bucket(24.9) == "13-24"
+    assert cr._tenure_bucket(60.5) == "49-60"
+    assert cr._tenure_bucket(61) == "61+"
+    assert cr._tenure_bucket(-1) == cr.UNKNOWN
+    assert cr._tenure_bucket(None) == cr.UNKNOWN
+    assert cr._tenure_bucket(float("nan")) == cr.UNKNOWN
+
+
+def test_apply_counts_every_dimension():
+    rollups = cr._empty_rollups()
+    for entry in HISTORY:
+        cr._apply(rollups, entry)
+    assert rollups["total"] == {"count": 3, "churn": 2}
+    assert rollups["day"] == {"2025-01-01": {"count": 1, "churn": 1}, "2025-01-02": {"count": 2, "churn": 1}}
+    assert rollups["Gender"]["Female"] == {"count": 2, "churn": 1}
+    assert rollups["Contract"] == {cr.UNKNOWN: {"count": 2, "churn": 2}, "One Year": {"count": 1, "churn": 0}}
+    assert rollups["tenure_bucket"]["61+"] == {"count": 1, "churn": 0}
+    assert rollups["tenure_bucket"][cr.UNKNOWN] == {"count": 1, "churn": 1}
+
+
+def test_rollup_rows_sorted_with_rates():
+    rollups = cr._empty_rollups()
+    for entry in HISTORY:
+        cr._apply(rollups, entry)
+    assert cr.rollup_rows(rollups, "day") == [
+        {"day": "2025-01-01", "count": 1, "churn": 1, "churn_rate": 1.0},
+        {"day": "2025-01-02", "count": 2, "churn": 1, "churn_rate": 0.5},
+    ]
+    assert cr.rollup_rows(rollups, "missing") == []
+
+
+def test_update_matches_rebuild(tmp_path):
+    history_path, rollups_path = tmp_path / "history.json", tmp_path / "rollups.json"
+    history_path.write_text(json.dumps(HISTORY))
+    cr.update_rollups(HISTORY[:1], str(rollups_path))
+    incremental = cr.update_rollups(HISTORY[1:], str(rollups_path))
+    assert incremental == cr.rebuild_rollups(str(history_path), str(rollups_path))
+    assert cr.load_rollups(str(rollups_path)) == incremental
+
+
+def test_ensure_builds_once_from_existing_history(tmp_path):
+    history_path, rollups_path = tmp_path / "history.json", tmp_path / "rollups.json"
+    history_path.write_text(json.dumps(HISTORY))
+    cr.ensure_rollups(str(history_path), str(rollups_path))
+    assert cr.load_rollups(str(rollups_path))["total"]["count"] == 3
+    history_path.write_text(json.dumps(HISTORY[:1]))
+    cr.ensure_rollups(str(history_path), str(rollups_path))
+    assert cr.load_rollups(str(rollups_path))["total"]["count"] == 3
+
+
+def test_rebuild_treats_corrupted_history_as_empty(tmp_path):
+    history_path, rollups_path = tmp_path / "history.json", tmp_path / "rollups.json"
+    history_path.write_text('[{"a":')
+    cr.ensure_rollups(str(history_path), str(rollups_path))
+    assert cr.load_rollups(str(rollups_path)) == cr._empty_rollups()
+
+
+def test_load_and_clear_missing_or_corrupted(tmp_path):
+    rollups_path = tmp_path / "rollups.json"
+    assert cr.load_rollups(str(rollups_path)) == cr._empty_rollups()
+    rollups_path.write_text("{")
+    assert cr.load_rollups(str(rollups_path)) == cr._empty_rollups()
+    cr.clear_rollups(str(rollups_path))
+    cr.clear_rollups(str(rollups_path))
+    assert not rollups_path.exists()
@@ -0,0 +1,104 @@
+import csv, datetime, gzip, io, json, os, time
+
+import pytest
+
+import exports as ex
+
+RECORDS = [
+    {"prediction": "Churn" if i % 3 == 0 else "No Churn", "timestamp": f"2025-01-{i % 28 + 1:02d}T10:00:00",
+     "note": 'quote " comma , brace } bracket ]' if i % 2 else "", "score": i * 0.5}
+    for i in range(200)
+] + [{"Prediction": "Churn", "timestamp": "2025-02-01 10:00:00", "State": "Delhi"}]
+
+
+def _write(tmp_path, text, name="store.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 7, 64, ex.BLOCK_SIZE])
+def test_iter_json_array_matches_json_load(tmp_path, block_size):
+    path = _write(tmp_path, json.dumps(RECORDS, indent=2))
+    assert list(ex.iter_json_array(path, block_size)) == RECORDS
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ ]\n", "[\n]"])
+def test_iter_json_array_empty(tmp_path, text):
+    assert list(ex.iter_json_array(_write(tmp_path, text), block_size=1)) == []
+
+
+def test_iter_json_array_missing_file(tmp_path):
+    assert list(ex.iter_json_array(str(tmp_path / "missing.json"))) == []
+
+
+def test_iter_json_array_scalars_split_across_blocks(tmp_path):
+    path = _write(tmp_path, "[12345, 6.5e3, \"a,b\", true, null]")
+    assert list(ex.iter_json_array(path, block_size=2)) == [12345, 6500.0, "a,b", True, None]
+
+
+@pytest.mark.parametrize("text", ["[,,{}]", "[{},]", "[{},,{}]", "[{} {}]", "[{\"a\":", "[{}", "", "{}"])
+@pytest.mark.parametrize("block_size", [1, 64])
+def test_iter_json_array_rejects_malformed(tmp_path, text, block_size):
+    with pytest.raises(ValueError):
+        list(ex.iter_json_array(_write(tmp_path, text), block_size))
+
+
+def test_iter_records_filters(tmp_path):
+    path = _write(tmp_path, json.dumps(RECORDS))
+    got = list(ex.iter_records(path, datetime.date(2025, 1, 5), datetime.date(2025, 1, 10), "Churn"))
+    expected = [r for r in RECORDS if r.get("prediction", r.get("Prediction")) == "Churn"
+                and "2025-01-05" <= r["timestamp"][:10] <= "2025-01-10"]
+    assert got == expected and got
+    assert list(ex.iter_records(path, start=datetime.date(2025, 2, 1)))[0]["State"] == "Delhi"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_csv_export_round_trip(tmp_path, compress):
+    path = _write(tmp_path, json.dumps(RECORDS))
+    data = b"".join(ex.iter_csv_export(path, prediction="Churn", compress=compress, chunk_rows=7))
+    text = (gzip.decompress(data) if compress else data).decode("utf-8")
+    rows = list(csv.DictReader(io.StringIO(text)))
+    expected = [r for r in RECORDS if r.get("prediction", r.get("Prediction")) == "Churn"]
+    assert len(rows) == len(expected)
+    assert list(rows[0]) == ["prediction", "timestamp", "note", "score", "Prediction", "State"]
+    assert rows[-1]["State"] == "Delhi" and rows[-1]["prediction"] == ""
+    assert [r["note"] for r in rows[:-1]] == [r["note"] for r in expected[:-1]]
+
+
+def test_write_export_is_unique_and_consumed_once(tmp_path):
+    path = _write(tmp_path, json.dumps(RECORDS))
+    export_dir = str(tmp_path / "exports")
+    a = ex.export_path(ex.export_filename("history", compress=True), export_dir)
+    b = ex.export_path(ex.export_filename("history", compress=True), export_dir)
+    assert a != b and a.endswith("_history.csv.gz")
+    ex.write_export(path, a, compress=True)
+    ex.write_export(path, b, compress=True)
+    assert sorted(os.listdir(export_dir)) == sorted([os.path.basename(a), os.path.basename(b)])
+    assert gzip.decompress(ex.consume_export(a)).startswith(b"prediction,timestamp")
+    assert not os.path.exists(a) and os.path.exists(b)
+
+
+def test_write_export_failure_leaves_no_temp_file(tmp_path):
+    path = _write(tmp_path, "[{},]")
+    out = str(tmp_path / "exports" / "x.csv")
+    with pytest.raises(ValueError):
+        ex.write_export(path, out)
+    assert os.listdir(tmp_path / "exports") == []
+
+
+def test_prune_exports_removes_only_old_files(tmp_path):
+    old, new = tmp_path / "old.csv", tmp_path / "new.csv"
+    old.write_text("x")
+    new.write_text("x")
+    stale = time.time() - ex.EXPORT_MAX_AGE - 10
+    os.utime(old, (stale, stale))
+    ex.prune_exports(str(tmp_path))
+    assert not old.exists() and new.exists()
+    ex.prune_exports(str(tmp_path / "missing"))
+
+
+def test_export_filename():
+    assert ex.export_filename("history", datetime.date(2025, 1, 1), None, "No Churn", True) == \
+        "history_from-2025-01-01_no-churn.csv.gz"
+    assert ex.export_filename("audit_log") == "audit_log.csv"
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import generate_data as gd
+
+
+@pytest.fixture(scope="module")
+def model():
+    return gd.fit_model(gd.SOURCE_PATH)
+
+
+def test_chunks_are_deterministic(model):
+    a = gd.generate_chunk(model, 7, 3, 0, 500)
+    b = gd.generate_chunk(model, 7, 3, 0, 500)
+    pd.testing.assert_frame_equal(a, b)
+    assert list(a.columns) == model["columns"]
+
+
+def test_charges_are_related(model):
+    df = gd.generate_chunk(model, 42, 0, 0, 25_000)
+    assert (df["Total_Charges"] >= df["Monthly_Charge"]).all()
+    assert df["Monthly_Charge"].corr(df["Total_Charges"]) > 0.4
+    expected = df["Total_Charges"] - df["Total_Refunds"] + df["Total_Extra_Data_Charges"] + df["Total_Long_Distance_Charges"]
+    assert np.allclose(df["Total_Revenue"], expected, atol=0.01)
+
+
+def test_churn_keeps_its_drivers(model):
+    source = pd.read_csv(gd.SOURCE_PATH)
+    df = gd.generate_chunk(model, 42, 0, 0, 20_000)
+    for col in ("Contract", "Internet_Type"):
+        expected = (source["Customer_Status"] == "Churned").groupby(source[col]).mean()
+        got = (df["Customer_Status"] == "Churned").groupby(df[col]).mean()
+        assert (got - expected).abs().max() < 0.03, col
+    churned = (df["Customer_Status"] == "Churned").astype(float)
+    assert churned.corr(df["Monthly_Charge"]) > 0.1
+
+
+def test_churn_details_only_for_churned(model):
+    df = gd.generate_chunk(model, 42, 0, 0, 5_000)
+    churned = df["Customer_Status"] == "Churned"
+    assert df.loc[~churned, "Churn_Reason"].isna().all()
+    assert df.loc[churned, "Churn_Category"].notna().all()
+    assert df["Customer_ID"].is_unique
+
+
+def test_output_independent_of_worker_count(tmp_path):
+    serial, parallel = tmp_path / "serial.csv", tmp_path / "parallel.csv"
+    assert gd.generate(2_500, str(serial), seed=1, chunk_size=400, workers=1) == 2_500
+    assert gd.generate(2_500, str(parallel), seed=1, chunk_size=400, workers=2) == 2_500
+    assert serial.read_bytes() == parallel.read_bytes()
+
+
+def test_zero_rows_writes_header(tmp_path, model):
+    out = tmp_path / "empty.csv"
+    assert gd.generate(0, str(out), workers=1) == 0
+    assert out.read_text().strip().split(",") == model["columns"]
+
+
+def test_parquet_schema_survives_chunks_without_churn(tmp_path):
+    pytest.importorskip("pyarrow")
+    out = tmp_path / "customers.parquet"
+    # Tiny chunks make all-null Churn_Reason chunks next to non-null ones
+    assert gd.generate(300, str(out), seed=3, chunk_size=2, workers=1) == 300
+    df = pd.read_parquet(out)
+    assert len(df) == 300
+    assert df["Churn_Reason"].notna().any() and df["Churn_Reason"].isna().any()
+
+    empty = tmp_path / "empty.parquet"
+    assert gd.generate(0, str(empty), workers=1) == 0
+    assert len(pd.read_parquet(empty)) == 0
@@ -1,14 +1,16 @@
+import sys
 import pandas as pd
 import joblib
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 
-# Load dataset
-df = pd.read_csv("Customer_Data.csv")
+# Load dataset (optionally a synthetic one from generate_data.py)
+data_path = sys.argv[1] if len(sys.argv) > 1 else "Customer_Data.csv"
+df = pd.read_csv(data_path)
 
 # 1. Drop ID-like columns automatically
 for col in df.columns:
-    if df[col].dtype == "object" and df[col].nunique() == len(df):
+    if not pd.api.types.is_numeric_dtype(df[col]) and df[col].nunique() == len(df):
         print(f"Dropping ID column: {col}")
         df = df.drop(columns=[col])
 